@@ -13,6 +13,91 @@
 
 namespace py = pybind11;
 
+namespace {
+
+/**
+ * @brief Hands a vector over to NumPy without copying its elements
+ * @param values Vector to move into the returned array
+ * @return 1-D array viewing the vector's storage
+ *
+ * The vector is moved to the heap and owned by a capsule, so the array
+ * stays valid for as long as Python holds a reference to it.
+ */
+template <typename T>
+py::array_t<T> vectorToArray(std::vector<T>&& values) {
+    auto* owned = new std::vector<T>(std::move(values));
+    py::capsule owner(owned, [](void* p) { delete static_cast<std::vector<T>*>(p); });
+    return py::array_t<T>(owned->size(), owned->data(), owner);
+}
+
+/**
+ * @brief Copies contiguous storage into a new NumPy array
+ * @param shape Array shape
+ * @param data Pointer to the first element
+ * @return Array owning a copy of the data
+ *
+ * Used for storage that grows with the packing, where a view could be
+ * left pointing at a freed buffer.
+ */
+template <typename T>
+py::array_t<T> copyArray(std::vector<py::ssize_t> shape, const T* data) {
+    return py::array_t<T>(shape, data);
+}
+
+/**
+ * @brief Keeps a generator alive for the particle wrappers handed out by one call
+ *
+ * Wrappers are tied to a lease instead of the generator, so each call
+ * records a single weak reference however many particles it returns.
+ */
+struct ParticleLease {
+    py::object generator;  ///< Generator the wrappers point into
+};
+
+/**
+ * @brief Gets the set of objects that refer into a generator's particles
+ * @param generator Python PackingGenerator object
+ * @return The generator's borrower set, created on first use
+ *
+ * Borrowers (particle leases and particle iterators) are held in a
+ * weakref.WeakSet in the generator's __dict__, so tracking them neither
+ * keeps them alive nor forms a reference cycle.
+ */
+py::object borrowers(py::object generator) {
+    py::dict attrs = generator.attr("__dict__");
+    if (!attrs.contains("_borrowers")) {
+        attrs["_borrowers"] = py::module::import("weakref").attr("WeakSet")();
+    }
+    return attrs["_borrowers"];
+}
+
+/**
+ * @brief Creates a tracked lease for the particle wrappers of one call
+ * @param generator Python PackingGenerator object
+ * @return Lease to pass as the parent of reference_internal casts
+ */
+py::object leaseParticles(py::object generator) {
+    py::object lease = py::cast(ParticleLease{generator});
+    borrowers(generator).attr("add")(lease);
+    return lease;
+}
+
+/**
+ * @brief Refuses to modify the particle storage while Python refers into it
+ * @param generator Python PackingGenerator object
+ * @param method Name of the method about to clear or grow the particles
+ * @throws std::runtime_error if a tracked borrower is still alive
+ */
+void requireNoBorrowers(py::object generator, const std::string& method) {
+    py::dict attrs = generator.attr("__dict__");
+    if (attrs.contains("_borrowers") && py::len(attrs["_borrowers"]) > 0) {
+        throw std::runtime_error(method + "() would invalidate Particle objects that are still "
+                                 "referenced; delete them before calling it");
+    }
+}
+
+} // namespace
+
 PYBIND11_MODULE(particle_packing, m) {
     m.doc() = "Python bindings for the Random Sequential Addition-based Particle Packing Generator";
 
@@ -70,12 +155,28 @@ PYBIND11_MODULE(particle_packing, m) {
                    ", sphereId=" + std::to_string(s.getSphereId()) + ")";
         });
 
+    // Internal lease tying particle wrappers to their generator
+    py::class_<ParticleLease>(m, "_ParticleLease");
+
     // Particle - More careful with collections and reference management
     py::class_<Packing::Particle>(m, "Particle")
         .def(py::init<uint16_t>())
         .def("getId", &Packing::Particle::getId)
         .def("getSpheres", &Packing::Particle::getSpheres, 
             py::return_value_policy::reference_internal)
+        .def("getSphereCount", &Packing::Particle::getSphereCount)
+        .def("getCenters", [](const Packing::Particle &p) {
+            return copyArray({static_cast<py::ssize_t>(p.getSphereCount()), 3},
+                             p.getCenters().data());
+        }, "Get the sphere centers as an (n, 3) int16 NumPy array")
+        .def("getRadii", [](const Packing::Particle &p) {
+            return copyArray({static_cast<py::ssize_t>(p.getSphereCount())},
+                             p.getRadii().data());
+        }, "Get the sphere radii as a uint8 NumPy array")
+        .def("getTypes", [](const Packing::Particle &p) {
+            return copyArray({static_cast<py::ssize_t>(p.getSphereCount())},
+                             p.getTypes().data());
+        }, "Get the sphere types (SphereType values) as a uint8 NumPy array")
         .def("getCoreSphere", [](const Packing::Particle &p) {
             auto sphere = p.getCoreSphere();
             if (sphere) {
@@ -101,7 +202,7 @@ PYBIND11_MODULE(particle_packing, m) {
         });
 
     // PackingGenerator - Main class
-    py::class_<Packing::PackingGenerator>(m, "PackingGenerator")
+    py::class_<Packing::PackingGenerator>(m, "PackingGenerator", py::dynamic_attr())
         .def(py::init<uint32_t, int, int, int, int, int, int, double, double, uint32_t>(),
              py::arg("size"),
              py::arg("coreRadiusMin") = 10, py::arg("coreRadiusMax") = 20,
@@ -110,34 +211,93 @@ PYBIND11_MODULE(particle_packing, m) {
              py::arg("targetDensity") = 0.6,
              py::arg("compactnessFactor") = 0.5,
              py::arg("randomSeed") = 0)
-        .def("generate", &Packing::PackingGenerator::generate)
+        .def("generate", [](py::object self) {
+            requireNoBorrowers(self, "generate");
+            return self.cast<Packing::PackingGenerator&>().generate();
+        })
         .def("getCurrentDensity", &Packing::PackingGenerator::getCurrentDensity)
-        .def("getParticle", [](const Packing::PackingGenerator &pg, uint32_t index) {
-            const Packing::Particle* p = pg.getParticle(index);
-            if (p) {
-                // Return a copy to ensure safety
-                return Packing::Particle(*p);
+        .def("getParticle", [](py::object self, uint32_t index) {
+            const Packing::Particle* p = self.cast<const Packing::PackingGenerator&>().getParticle(index);
+            if (!p) {
+                throw py::index_error("Particle index out of range");
             }
-            throw py::index_error("Particle index out of range");
-        }, py::return_value_policy::copy)
+            return py::cast(p, py::return_value_policy::reference_internal, leaseParticles(self));
+        }, py::arg("index"),
+           "Get a particle; while a wrapper for it is alive, the same object is returned")
         .def("getSphere", &Packing::PackingGenerator::getSphere, 
              py::arg("index"), 
              "Get sphere at specified index (returns None if index out of range)")
         .def("getParticleCount", &Packing::PackingGenerator::getParticleCount)
         .def("getSphereCount", &Packing::PackingGenerator::getSphereCount)
-        .def("getParticles", &Packing::PackingGenerator::getParticles,
-             py::return_value_policy::reference_internal)
+        .def("getParticles", [](py::object self) {
+            const auto& particles = self.cast<const Packing::PackingGenerator&>().getParticles();
+            py::object lease = leaseParticles(self);
+            py::list result(particles.size());
+            for (size_t i = 0; i < particles.size(); ++i) {
+                result[i] = py::cast(&particles[i], py::return_value_policy::reference_internal, lease);
+            }
+            return result;
+        }, "Get a list of all particles")
+        .def("iterParticles", [](py::object self) {
+            // Yielded particles keep the iterator alive, so tracking it covers them too
+            const auto& particles = self.cast<const Packing::PackingGenerator&>().getParticles();
+            py::object iterator = py::make_iterator(particles.begin(), particles.end());
+            borrowers(self).attr("add")(iterator);
+            return iterator;
+        }, py::keep_alive<0, 1>(),
+           "Iterate over the particles without materializing a list of all of them")
         .def("getContactCount", &Packing::PackingGenerator::getContactCount)
         .def("getAverageCoordinationNumber", &Packing::PackingGenerator::getAverageCoordinationNumber)
-        .def("getCoordinationNumbers", &Packing::PackingGenerator::getCoordinationNumbers, 
-             py::return_value_policy::copy)
+        .def("getCoordinationNumbers", [](const Packing::PackingGenerator &pg) {
+            return vectorToArray(pg.getCoordinationNumbers());
+        }, "Get the coordination number of every particle as a NumPy array")
+        .def("getVolumes", [](const Packing::PackingGenerator &pg) {
+            return vectorToArray(pg.getVolumes());
+        }, "Get the volume (bulk voxels) of every particle as a NumPy array")
+        .def("getAreas", [](const Packing::PackingGenerator &pg) {
+            return vectorToArray(pg.getAreas());
+        }, "Get the surface area (surface voxels) of every particle as a NumPy array")
+        .def("getSphericities", [](const Packing::PackingGenerator &pg) {
+            return vectorToArray(pg.getSphericities());
+        }, "Get the sphericity of every particle as a NumPy array")
         .def("getAverageSphericity", &Packing::PackingGenerator::getAverageSphericity)
-        .def("saveTIFF", &Packing::PackingGenerator::saveTIFF, 
-             py::arg("filename"), py::arg("binary") = true)
+        .def("saveTIFF", [](const Packing::PackingGenerator &pg, const std::string& filename,
+                            bool binary, const std::string& compression) {
+            Packing::TiffCompression scheme;
+            if (compression == "none") {
+                scheme = Packing::TiffCompression::NONE;
+            } else if (compression == "lzw") {
+                scheme = Packing::TiffCompression::LZW;
+            } else if (compression == "deflate") {
+                scheme = Packing::TiffCompression::DEFLATE;
+            } else {
+                throw py::value_error("compression must be 'none', 'lzw' or 'deflate'");
+            }
+            return pg.saveTIFF(filename, binary, scheme);
+        }, py::arg("filename"), py::arg("binary") = true, py::arg("compression") = "none",
+           "Save the packing as a TIFF stack; 'lzw' and 'deflate' write compressed tiles")
         
         // NEW BINDINGS - Direct access to requested methods
-        .def("insertCoreSpheres", &Packing::PackingGenerator::insertCoreSpheres,
-             "Insert core spheres into the domain and return the number of spheres successfully placed")
+        .def("insertCoreSpheres", [](py::object self) {
+            requireNoBorrowers(self, "insertCoreSpheres");
+            return self.cast<Packing::PackingGenerator&>().insertCoreSpheres();
+        }, "Insert core spheres into the domain and return the number of spheres successfully placed")
+        .def("setCellSize", &Packing::PackingGenerator::setCellSize, py::arg("cellSize"),
+             "Set the edge length (voxels) of the cell list used for overlap tests")
+        .def("getCellSize", &Packing::PackingGenerator::getCellSize,
+             "Get the edge length (voxels) of the cell list used for overlap tests")
+        .def("setThreads", &Packing::PackingGenerator::setThreads, py::arg("threads"),
+             "Set the number of threads used to insert core and secondary spheres (0 uses all cores)")
+        .def("getThreads", &Packing::PackingGenerator::getThreads,
+             "Get the number of threads used to insert core and secondary spheres")
+        .def("reset", [](py::object self, double targetDensity) {
+            requireNoBorrowers(self, "reset");
+            self.cast<Packing::PackingGenerator&>().reset(targetDensity);
+        }, py::arg("targetDensity"),
+           "Clear the packing in place so generate() can run again with a new target density; "
+           "raises RuntimeError while Particle objects from this generator are referenced")
+        .def("freeze", &Packing::PackingGenerator::freeze,
+             "Precompute the cached sphericity of every particle, e.g. after insertSuppSpheres")
         .def("getAverageParticleRadius", &Packing::PackingGenerator::getAverageParticleRadius,
              "Calculate the average particle radius using equivalent sphere volume")
         .def("getTotalVolume", &Packing::PackingGenerator::getTotalVolume,
@@ -0,0 +1,147 @@
+/**
+ * @file CellList.h
+ * @brief CellList class definition for the Random Packing Generator
+ * @author Amirmehdi Salehi
+ * @date 2024
+ * @copyright MIT License
+ *
+ * This file defines the CellList class, a uniform-grid (link-cell)
+ * neighbor structure used to test candidate spheres for excessive
+ * overlap with the spheres already placed in the domain.
+ */
+
+#ifndef PACKING_CELL_LIST_H
+#define PACKING_CELL_LIST_H
+
+#include "Core.h"
+#include <vector>
+#include <cstdint>
+
+namespace Packing {
+
+/**
+ * @class CellList
+ * @brief Uniform grid of cubic cells binning spheres by their centers
+ * 
+ * Each sphere is stored in the cell containing its center. An overlap
+ * query only visits the cells within reach of the candidate sphere
+ * (the 27 surrounding cells when the cell edge is at least the largest
+ * possible center distance), and compares squared center distances in
+ * integer arithmetic, avoiding square roots.
+ * 
+ * Every cell also keeps the bounding box of the spheres it holds, so a
+ * cell whose box is out of reach of the candidate is rejected with one
+ * ball-box test before any of its spheres are examined.
+ */
+class CellList {
+public:
+    /**
+     * @struct Entry
+     * @brief Sphere data stored in a cell
+     * 
+     * Coordinates and radius are stored in the narrowest types that fit
+     * the supported domain (see PackingGenerator) to cut memory traffic.
+     */
+    struct Entry {
+        int16_t x;            ///< Center X coordinate in voxel space
+        int16_t y;            ///< Center Y coordinate in voxel space
+        int16_t z;            ///< Center Z coordinate in voxel space
+        uint16_t particleId;  ///< ID of the parent particle
+        uint8_t radius;       ///< Sphere radius in voxels
+    };
+
+    /**
+     * @struct Cell
+     * @brief Spheres binned into one cell and their bounding box
+     */
+    struct Cell {
+        std::vector<Entry> entries;  ///< Spheres whose centers lie in this cell
+        Point3D boxMin;              ///< Lower corner of the spheres' bounding box
+        Point3D boxMax;              ///< Upper corner of the spheres' bounding box
+    };
+
+    /**
+     * @brief Constructs an empty cell list covering a cubic domain
+     * @param domainSize Cubic domain dimension in voxels
+     * @param cellSize Edge length of each cell in voxels
+     */
+    CellList(uint32_t domainSize, uint32_t cellSize);
+
+    /**
+     * @brief Gets the edge length of the cells
+     * @return Cell size in voxels
+     */
+    uint32_t getCellSize() const { return cellSize; }
+
+    /**
+     * @brief Changes the cell size and re-bins all stored spheres
+     * @param newCellSize New edge length in voxels (must be positive)
+     */
+    void setCellSize(uint32_t newCellSize);
+
+    /**
+     * @brief Adds a sphere to the cell containing its center
+     * @param center Center coordinates of the sphere
+     * @param radius Radius of the sphere
+     * @param particleId ID of the parent particle
+     */
+    void insert(const Point3D& center, int radius, uint16_t particleId);
+
+    /**
+     * @brief Removes all spheres, keeping the cells' storage
+     */
+    void clear();
+
+    /**
+     * @brief Checks a candidate sphere for excessive overlap
+     * @param center Center coordinates of the candidate
+     * @param radius Radius of the candidate
+     * @param maxPenetration Allowed penetration depth in voxels
+     * @param excludeParticleId Particle whose spheres are ignored (-1 for none)
+     * @return true if any stored sphere satisfies d < r1 + r2 - maxPenetration
+     */
+    bool hasExcessiveOverlap(const Point3D& center, int radius, int maxPenetration,
+                             int excludeParticleId = -1) const;
+
+private:
+    uint32_t domainSize;                  ///< Domain size in voxels
+    uint32_t cellSize;                    ///< Cell edge length in voxels
+    uint32_t cellsPerSide;                ///< Number of cells per dimension
+    int maxRadius;                        ///< Largest radius stored so far
+    std::vector<Cell> cells;              ///< Sphere entries per cell
+
+    /**
+     * @brief Gets the cell coordinate of a voxel coordinate, clamped to the grid
+     * @param coord Coordinate along one axis
+     * @return Cell coordinate along that axis
+     */
+    int getCellCoord(int coord) const;
+
+    /**
+     * @brief Gets the linear index of a cell
+     * @param cx Cell X coordinate
+     * @param cy Cell Y coordinate
+     * @param cz Cell Z coordinate
+     * @return Index into the cell array
+     */
+    uint32_t getCellIndex(int cx, int cy, int cz) const;
+
+    /**
+     * @brief Adds an entry to its cell and grows the cell's bounding box
+     * @param entry Sphere to store
+     */
+    void addEntry(const Entry& entry);
+
+    /**
+     * @brief Tests whether a cell may hold a sphere overlapping the candidate
+     * @param cell Cell to test
+     * @param center Center coordinates of the candidate
+     * @param reach Candidate radius minus the allowed penetration
+     * @return false if no sphere in the cell can overlap the candidate
+     */
+    static bool mayOverlap(const Cell& cell, const Point3D& center, int reach);
+};
+
+} // namespace Packing
+
+#endif // PACKING_CELL_LIST_H
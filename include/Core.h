@@ -46,6 +46,19 @@ enum class VoxelType {
     AIR,      ///< Empty space outside particles
 };
 
+/**
+ * @enum TiffCompression
+ * @brief Compression scheme used when saving the voxel grid as a TIFF stack
+ * 
+ * Compressed stacks are written as 128×128 tiles; uncompressed stacks
+ * keep the plain strip layout.
+ */
+enum class TiffCompression {
+    NONE,     ///< Uncompressed strips
+    LZW,      ///< LZW-compressed tiles (encoded by libtiff)
+    DEFLATE   ///< Deflate-compressed tiles (encoded in parallel)
+};
+
 /**
  * @struct Point3D
  * @brief Represents a discrete 3D coordinate in the voxel grid
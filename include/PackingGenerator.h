@@ -16,11 +16,13 @@
 #include "Core.h"
 #include "Particle.h"
 #include "VoxelGrid.h"
+#include "CellList.h"
 #include <memory>
 #include <vector>
 #include <string>
 #include <cstdint>
 #include <utility>
+#include <random>
 
 // Forward declaration for spatial indexing
 namespace SpatialIndex {
@@ -56,6 +58,7 @@ public:
      * @param tertiaryVolumeFraction Volume fraction of tertiary spheres (0-1)
      * @param targetDensity Target packing density to achieve
      * @param compactnessFactor Controls sphere overlap (0-1, default 0.5)
+     * @throws std::invalid_argument if size exceeds 32767 or a radius exceeds 255
      */
     PackingGenerator(
         uint32_t size,
@@ -136,6 +139,24 @@ public:
      * @return Vector of coordination numbers
      */
     std::vector<uint32_t> getCoordinationNumbers() const;
+
+    /**
+     * @brief Gets the volumes of all particles
+     * @return Vector of bulk voxel counts, in particle order
+     */
+    std::vector<uint32_t> getVolumes() const;
+    
+    /**
+     * @brief Gets the surface areas of all particles
+     * @return Vector of surface voxel counts, in particle order
+     */
+    std::vector<uint32_t> getAreas() const;
+    
+    /**
+     * @brief Gets the sphericities of all particles
+     * @return Vector of sphericity values (0-1), in particle order
+     */
+    std::vector<double> getSphericities() const;
     
     /**
      * @brief Calculates the average sphericity index
@@ -160,9 +181,11 @@ public:
      * @param filename Output filename
      * @param binary If true, save as binary (filled/empty),
      *               otherwise save particle IDs
+     * @param compression Compression scheme; compressed stacks are written as tiles
      * @return true if save was successful
      */
-    bool saveTIFF(const std::string& filename, bool binary = true) const;
+    bool saveTIFF(const std::string& filename, bool binary = true,
+                  TiffCompression compression = TiffCompression::NONE) const;
 
     /**
      * @brief Gets all contact pairs between particles 
@@ -191,6 +214,7 @@ public:
      * @param radius Radius of the sphere
      * @param particleID ID of the particle to add the sphere to
      * @return true if sphere was successfully added, false otherwise
+     *         (including radii above 255 or coordinates outside the int16 range)
      * 
      * This method adds a sphere to an existing particle following the same
      * compactness criteria as secondary spheres, but without overlap checking
@@ -209,6 +233,66 @@ public:
      * Made public for RL integration.
      */
     uint32_t insertCoreSpheres();
+
+    /**
+     * @brief Sets the edge length of the overlap-test cell list
+     * @param cellSize Cell edge in voxels (must be positive)
+     * 
+     * Overlap queries visit every cell within reach of a candidate sphere,
+     * so any size gives the same result. An edge of about twice the
+     * largest sphere radius (the default) keeps each query to 27 cells.
+     */
+    void setCellSize(uint32_t cellSize);
+
+    /**
+     * @brief Gets the edge length of the overlap-test cell list
+     * @return Cell edge in voxels
+     */
+    uint32_t getCellSize() const { return cellList.getCellSize(); }
+
+    /**
+     * @brief Sets the number of threads used for core and secondary insertion
+     * @param threads Thread count (0 or less selects all available cores)
+     * 
+     * With more than one thread, candidate spheres are proposed and checked
+     * against the packing in parallel batches, each thread drawing from its
+     * own std::mt19937_64 stream, and the accepted candidates are committed
+     * one at a time in batch order. Results are reproducible for a given
+     * seed and thread count, but differ from the serial generator, which
+     * is used with one thread (the default). Without OpenMP support the
+     * generator always runs serially.
+     */
+    void setThreads(int threads);
+
+    /**
+     * @brief Gets the number of threads used for sphere insertion
+     * @return Thread count
+     */
+    int getThreads() const { return numThreads; }
+
+    /**
+     * @brief Clears the packing so the generator can be run again
+     * @param targetDensity Target packing density of the next run
+     * 
+     * Particles, the voxel grid, the cell list and the sphere R-tree are
+     * emptied in place, keeping their allocations and the cached sphere
+     * masks, so parameter sweeps do not pay the setup cost of a new
+     * generator for every run. The random streams continue, so each run
+     * produces a different packing. As with std::vector::clear(), pointers
+     * and references to particles obtained before the reset are invalidated;
+     * the Python binding refuses to reset while particle wrappers are alive.
+     */
+    void reset(double targetDensity);
+
+    /**
+     * @brief Precomputes the cached properties of every particle
+     * 
+     * Fills each particle's sphericity cache in parallel, so later
+     * queries are plain lookups. generate() already leaves the caches
+     * filled; call this after adding spheres with insertSuppSpheres(),
+     * which invalidates the caches of the affected particles.
+     */
+    void freeze();
  
 private:
     // Configuration parameters
@@ -228,7 +312,24 @@ private:
     std::vector<Particle> particles;          ///< All particles
     std::vector<std::shared_ptr<Sphere>> spheres; 
     VoxelGrid voxelGrid;                      ///< 3D voxel representation
+    std::unique_ptr<SpatialIndex::IStorageManager> sphereStorage; ///< Storage of the sphere R-tree
     std::unique_ptr<SpatialIndex::ISpatialIndex> spatialIndex; ///< Sphere R-tree
+    CellList cellList;                        ///< Cell list for overlap tests
+    
+    // Parallel insertion state
+    int numThreads;                           ///< Threads used for sphere insertion
+    uint32_t rngSeed;                         ///< Seed of the per-thread generators
+    std::vector<std::mt19937_64> threadRngs;  ///< One random stream per thread
+    
+    /**
+     * @brief A sphere proposed during parallel insertion
+     */
+    struct Candidate {
+        Point3D center;          ///< Sphere center
+        int radius;              ///< Sphere radius
+        uint32_t particleIndex;  ///< Owning particle (secondary spheres only)
+        bool valid;              ///< Whether the candidate passed its checks
+    };
     
 
     
@@ -254,6 +355,53 @@ private:
      */
     uint32_t addTertiarySpheres(uint32_t maxAttempts = 5000);
     
+    /**
+     * @brief Stage 1 with candidates proposed in parallel batches
+     * @return Number of core spheres successfully placed
+     */
+    uint32_t insertCoreSpheresParallel();
+    
+    /**
+     * @brief Stage 2 with candidates proposed in parallel batches
+     * @param maxAttempts Maximum placement attempts before stopping
+     * @return Number of secondary spheres successfully placed
+     */
+    uint32_t addSecondarySpheresParallel(uint32_t maxAttempts);
+    
+    /**
+     * @brief Proposes a core sphere and checks it against the current packing
+     * @param rng Random stream of the calling thread
+     * @return The candidate, marked valid if it fits the domain without excessive overlap
+     */
+    Candidate proposeCoreSphere(std::mt19937_64& rng) const;
+    
+    /**
+     * @brief Proposes a secondary sphere and checks it against the current packing
+     * @param rng Random stream of the calling thread
+     * @return The candidate, marked valid if it fits the domain, is compact
+     *         with its particle and has no excessive overlap with other particles
+     */
+    Candidate proposeSecondarySphere(std::mt19937_64& rng) const;
+    
+    /**
+     * @brief Adds a core or secondary sphere to a particle and to all packing structures
+     * @param particle Particle receiving the sphere
+     * @param center Sphere center
+     * @param radius Sphere radius
+     * @param type Sphere type
+     */
+    void commitSphere(Particle& particle, const Point3D& center, int radius, SphereType type);
+    
+    /**
+     * @brief Creates an empty sphere R-tree, replacing any existing one
+     */
+    void createSphereIndex();
+    
+    /**
+     * @brief Seeds one random stream per thread from the generator seed
+     */
+    void seedThreadRngs();
+    
     /**
      * @brief Generates a random point within the domain
      * @return Random 3D point
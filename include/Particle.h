@@ -63,6 +63,42 @@ public:
      * @return Const reference to the sphere vector
      */
     const std::vector<std::shared_ptr<Sphere>>& getSpheres() const { return spheres; }
+
+    /**
+     * @brief Gets the number of spheres composing this particle
+     * @return Sphere count
+     */
+    size_t getSphereCount() const { return radii.size(); }
+
+    /**
+     * @brief Gets the sphere centers as a contiguous array
+     * @return Coordinates interleaved as x0, y0, z0, x1, y1, z1, ...
+     */
+    const std::vector<int16_t>& getCenters() const { return centers; }
+
+    /**
+     * @brief Gets the sphere radii as a contiguous array
+     * @return Radius of each sphere, in insertion order
+     */
+    const std::vector<uint8_t>& getRadii() const { return radii; }
+
+    /**
+     * @brief Gets the sphere types as a contiguous array
+     * @return SphereType of each sphere stored as uint8_t, in insertion order
+     */
+    const std::vector<uint8_t>& getTypes() const { return types; }
+
+    /**
+     * @brief Checks a candidate sphere against the compactness criteria
+     * @param center Center coordinates of the candidate
+     * @param radius Radius of the candidate
+     * @param beta Compactness factor (0-1) controlling allowed overlap
+     * @return true if the candidate meets the criteria with at least one sphere
+     * 
+     * Equivalent to calling Sphere::intersectsWith on every sphere of the
+     * particle, but scans the contiguous center and radius arrays.
+     */
+    bool isCompactWith(const Point3D& center, int radius, double beta) const;
     
     /**
      * @brief Finds and returns the core sphere of this particle
@@ -85,29 +121,30 @@ public:
     /**
      * @brief Increments the bulk voxel count
      */
-    void incrementVolume() { bulkCount++; }
+    void incrementVolume() { bulkCount++; cachedSphericity = -1.0; }
 
     /**
      * @brief Decrements the bulk voxel count
      */
-    void decrementVolume() { bulkCount--; }
+    void decrementVolume() { bulkCount--; cachedSphericity = -1.0; }
 
     /**
      * @brief Increments the surface voxel count
      */
-    void incrementArea() { surfaceCount++; }
+    void incrementArea() { surfaceCount++; cachedSphericity = -1.0; }
  
     /**
      * @brief Decrements the surface voxel count
      */
-    void decrementArea() { surfaceCount--; }
+    void decrementArea() { surfaceCount--; cachedSphericity = -1.0; }
     
     /**
      * @brief Calculates the sphericity index of this particle
      * @return Sphericity value (0-1, where 1 is a perfect sphere)
      * 
      * Uses the formula: Sphericity = (36π × V²) / S³
-     * where V is volume and S is surface area
+     * where V is volume and S is surface area. The value is cached
+     * until the volume or surface area changes.
      */
     double calculateSphericity() const;
     
@@ -136,7 +173,14 @@ private:
     uint16_t id;                ///< Unique particle identifier
     uint32_t bulkCount;         ///< Number of interior voxels (volume)
     uint32_t surfaceCount;      ///< Number of surface voxels (area)
+    mutable double cachedSphericity; ///< Last computed sphericity, negative if stale
     std::vector<std::shared_ptr<Sphere>> spheres; ///< Component spheres of this particle
+    
+    // Structure-of-arrays copy of the sphere data for cache-friendly scans,
+    // narrowed to the ranges PackingGenerator supports
+    std::vector<int16_t> centers;  ///< Sphere centers, x/y/z interleaved
+    std::vector<uint8_t> radii;    ///< Sphere radii
+    std::vector<uint8_t> types;    ///< Sphere types
 };
 
 } // namespace Packing
@@ -26,6 +26,9 @@ namespace SpatialIndex {
     namespace RTree { class RTree; }
 }
 
+// Forward declaration for TIFF output
+typedef struct tiff TIFF;
+
 namespace Packing {
 
 /**
@@ -56,6 +59,14 @@ public:
      * @return Grid dimension
      */
     uint32_t getSize() const { return size; }
+
+    /**
+     * @brief Empties the grid while keeping its allocations
+     * 
+     * All voxels are set to air and the interface segments are dropped.
+     * The cached sphere masks are kept for the next packing.
+     */
+    void clear();
            
     /**
      * @brief Adds a sphere to the voxel grid
@@ -163,9 +174,11 @@ public:
      * @param filename Output filename
      * @param binary If true, save as binary (filled/empty), 
      *               otherwise save particle IDs
+     * @param compression Compression scheme for the image data
      * @return true if successful
      */
-    bool saveToTIFF(const std::string& filename, bool binary = true) const;
+    bool saveToTIFF(const std::string& filename, bool binary = true,
+                    TiffCompression compression = TiffCompression::NONE) const;
  
 private:
     // Grid dimensions and chunk management
@@ -181,8 +194,14 @@ private:
     // Optimization caches and spatial indices
     std::unordered_map<int, std::vector<VoxelType>> sphericalMasks; ///< Cached sphere templates
     std::unordered_map<int, std::shared_ptr<Interface>> interfacialSegments;  ///< Contact regions
+    std::unique_ptr<SpatialIndex::IStorageManager> segmentStorage;   ///< Storage of the segment R-tree
     std::unique_ptr<SpatialIndex::ISpatialIndex> spatialIndexSegs;   ///< R-tree for segments
 
+    /**
+     * @brief Creates an empty segment R-tree, replacing any existing one
+     */
+    void createSegmentIndex();
+
     /**
      * @brief Calculates chunk coordinates for a point
      * @param center Point coordinates
@@ -210,6 +229,23 @@ private:
      * @return Index within the chunk array
      */
     uint32_t getLocalIndex(const Point3D& center) const;
+
+    /**
+     * @brief Fills a buffer with one Z-slice of the grid
+     * @param z Slice index
+     * @param binary If true, store filled/empty instead of voxel values
+     * @param buffer Output buffer of size × size values, row-major in Y
+     */
+    void fillSlice(uint32_t z, bool binary, uint16_t* buffer) const;
+
+    /**
+     * @brief Writes one Z-slice as compressed tiles of the current TIFF page
+     * @param tif Open TIFF handle with the page tags already set
+     * @param slice Slice data as produced by fillSlice()
+     * @param compression Compression scheme (LZW or DEFLATE)
+     * @return true if all tiles were written
+     */
+    bool writeTiles(TIFF* tif, const uint16_t* slice, TiffCompression compression) const;
 };
 
 } // namespace Packing
@@ -0,0 +1,155 @@
+/**
+ * @file CellList.cpp
+ * @brief Implementation of the CellList class
+ * @author Amirmehdi Salehi
+ * @date 2024
+ * @copyright MIT License
+ *
+ * This file contains the implementation of the CellList class methods.
+ */
+
+#include "CellList.h"
+#include <algorithm>
+
+namespace Packing {
+
+//=============================================================================
+// CellList Implementation
+//=============================================================================
+
+CellList::CellList(uint32_t domainSize, uint32_t cellSize)
+    : domainSize(domainSize), cellSize(std::max(cellSize, 1u)), maxRadius(0) {
+    cellsPerSide = (domainSize + this->cellSize - 1) / this->cellSize;
+    cells.resize(cellsPerSide * cellsPerSide * cellsPerSide);
+}
+
+void CellList::setCellSize(uint32_t newCellSize) {
+    // Collect all entries before rebuilding the grid
+    std::vector<Entry> entries;
+    for (const auto& cell : cells) {
+        entries.insert(entries.end(), cell.entries.begin(), cell.entries.end());
+    }
+    
+    cellSize = std::max(newCellSize, 1u);
+    cellsPerSide = (domainSize + cellSize - 1) / cellSize;
+    cells.assign(cellsPerSide * cellsPerSide * cellsPerSide, Cell());
+    
+    // Re-bin the entries into the new cells
+    for (const auto& entry : entries) {
+        addEntry(entry);
+    }
+}
+
+void CellList::insert(const Point3D& center, int radius, uint16_t particleId) {
+    addEntry({static_cast<int16_t>(center.x), 
+              static_cast<int16_t>(center.y), 
+              static_cast<int16_t>(center.z), 
+              particleId, 
+              static_cast<uint8_t>(radius)});
+    maxRadius = std::max(maxRadius, radius);
+}
+
+void CellList::clear() {
+    for (auto& cell : cells) {
+        cell.entries.clear();
+    }
+    maxRadius = 0;
+}
+
+void CellList::addEntry(const Entry& entry) {
+    Cell& cell = cells[getCellIndex(getCellCoord(entry.x),
+                                    getCellCoord(entry.y),
+                                    getCellCoord(entry.z))];
+    
+    Point3D low(entry.x - entry.radius, 
+                entry.y - entry.radius, 
+                entry.z - entry.radius);
+    Point3D high(entry.x + entry.radius, 
+                 entry.y + entry.radius, 
+                 entry.z + entry.radius);
+    
+    if (cell.entries.empty()) {
+        cell.boxMin = low;
+        cell.boxMax = high;
+    } else {
+        cell.boxMin = Point3D(std::min(cell.boxMin.x, low.x), 
+                              std::min(cell.boxMin.y, low.y), 
+                              std::min(cell.boxMin.z, low.z));
+        cell.boxMax = Point3D(std::max(cell.boxMax.x, high.x), 
+                              std::max(cell.boxMax.y, high.y), 
+                              std::max(cell.boxMax.z, high.z));
+    }
+    cell.entries.push_back(entry);
+}
+
+bool CellList::hasExcessiveOverlap(const Point3D& center, int radius, int maxPenetration,
+                                   int excludeParticleId) const {
+    // Spheres with centers farther than this cannot overlap the candidate
+    int reach = radius + maxRadius - maxPenetration;
+    if (reach <= 0) {
+        return false;
+    }
+    
+    // Range of cells within reach of the candidate
+    int minX = getCellCoord(center.x - reach), maxX = getCellCoord(center.x + reach);
+    int minY = getCellCoord(center.y - reach), maxY = getCellCoord(center.y + reach);
+    int minZ = getCellCoord(center.z - reach), maxZ = getCellCoord(center.z + reach);
+    
+    for (int cx = minX; cx <= maxX; ++cx) {
+        for (int cy = minY; cy <= maxY; ++cy) {
+            for (int cz = minZ; cz <= maxZ; ++cz) {
+                const Cell& cell = cells[getCellIndex(cx, cy, cz)];
+                if (!mayOverlap(cell, center, radius - maxPenetration)) {
+                    continue;
+                }
+                
+                for (const auto& entry : cell.entries) {
+                    if (entry.particleId == excludeParticleId) {
+                        continue;
+                    }
+                    
+                    // Overlap if d < r1 + r2 - maxPenetration, compared squared
+                    int minDistance = radius + entry.radius - maxPenetration;
+                    if (minDistance <= 0) {
+                        continue;
+                    }
+                    int dx = center.x - entry.x;
+                    int dy = center.y - entry.y;
+                    int dz = center.z - entry.z;
+                    if (dx*dx + dy*dy + dz*dz < minDistance * minDistance) {
+                        return true;
+                    }
+                }
+            }
+        }
+    }
+    
+    return false;
+}
+
+bool CellList::mayOverlap(const Cell& cell, const Point3D& center, int reach) {
+    if (cell.entries.empty()) {
+        return false;
+    }
+    
+    // Squared distance from the candidate center to the cell's bounding box
+    int dx = std::max({cell.boxMin.x - center.x, 0, center.x - cell.boxMax.x});
+    int dy = std::max({cell.boxMin.y - center.y, 0, center.y - cell.boxMax.y});
+    int dz = std::max({cell.boxMin.z - center.z, 0, center.z - cell.boxMax.z});
+    int distanceSq = dx*dx + dy*dy + dz*dz;
+    
+    // A sphere overlapping the candidate (d < r1 + r2 - maxPenetration) either
+    // contains the candidate center or has a point closer to it than reach
+    return distanceSq == 0 || (reach > 0 && distanceSq < reach * reach);
+}
+
+int CellList::getCellCoord(int coord) const {
+    int cell = coord < 0 ? 0 : coord / static_cast<int>(cellSize);
+    return std::min(cell, static_cast<int>(cellsPerSide) - 1);
+}
+
+uint32_t CellList::getCellIndex(int cx, int cy, int cz) const {
+    return cz + cy * cellsPerSide + cx * cellsPerSide * cellsPerSide;
+}
+
+} // namespace Packing
@@ -17,6 +17,12 @@
 #include <algorithm>
 #include <ctime>
 #include <set>
+#include <limits>
+#include <stdexcept>
+
+#ifdef _OPENMP
+    #include <omp.h>
+#endif
 
 #ifdef _WIN32
     #include <process.h>  // For _getpid() on Windows
@@ -30,6 +36,46 @@ namespace Packing {
 const int MAX_PENETRATION = 3;
 const double VICINITY_RATIO = 2.5;
 
+// Sphere coordinates are stored as int16_t and radii as uint8_t
+const uint32_t MAX_DOMAIN_SIZE = std::numeric_limits<int16_t>::max();
+const int MAX_SPHERE_RADIUS = std::numeric_limits<uint8_t>::max();
+
+// Candidates each thread proposes per batch of parallel insertion
+const uint32_t CANDIDATES_PER_THREAD = 16;
+
+/**
+ * @brief Validates the domain size and radii against the compact sphere storage
+ * @param size Domain size in voxels
+ * @param maxRadius Largest sphere radius of any stage
+ * @return size, if both are within limits
+ * @throws std::invalid_argument if either limit is exceeded
+ * 
+ * Called from the constructor's initializer list so that invalid input is
+ * rejected before the voxel grid and cell list are allocated.
+ */
+static uint32_t checkedSize(uint32_t size, int maxRadius) {
+    if (size > MAX_DOMAIN_SIZE) {
+        throw std::invalid_argument("Domain size must not exceed " + 
+                                    std::to_string(MAX_DOMAIN_SIZE));
+    }
+    if (maxRadius > MAX_SPHERE_RADIUS) {
+        throw std::invalid_argument("Sphere radii must not exceed " + 
+                                    std::to_string(MAX_SPHERE_RADIUS));
+    }
+    return size;
+}
+
+/**
+ * @brief Index of the calling OpenMP thread (0 without OpenMP)
+ */
+static int currentThread() {
+#ifdef _OPENMP
+    return omp_get_thread_num();
+#else
+    return 0;
+#endif
+}
+
 
 //=============================================================================
 // Constructor and Initialization
@@ -43,18 +89,41 @@ PackingGenerator::PackingGenerator(
     double targetDensity,
     double compactnessFactor,
     uint32_t randomSeed
-) : size(size),
+) : size(checkedSize(size, std::max({coreRadiusMax, secondaryRadiusMax, tertiaryRadiusMax}))),
     numSpheres(0),
     coreRadiusMin(coreRadiusMin), coreRadiusMax(coreRadiusMax),
     secondaryRadiusMin(secondaryRadiusMin), secondaryRadiusMax(secondaryRadiusMax),
     tertiaryRadiusMin(tertiaryRadiusMin), tertiaryRadiusMax(tertiaryRadiusMax),
     targetDensity(targetDensity),
     compactnessFactor(compactnessFactor),
-    voxelGrid(size) {
+    voxelGrid(size),
+    cellList(size, 2 * std::max({coreRadiusMax, secondaryRadiusMax, tertiaryRadiusMax})),
+    numThreads(1),
+    rngSeed(randomSeed) {
     
     // Initialize spatial index for sphere overlap detection
-    SpatialIndex::IStorageManager* memoryManager = 
-        SpatialIndex::StorageManager::createNewMemoryStorageManager();
+    createSphereIndex();
+    
+    // Initialize random seed for reproducible results
+    if (rngSeed == 0) {
+        // Use microsecond precision + process ID for uniqueness
+        auto now = std::chrono::high_resolution_clock::now();
+        auto duration = now.time_since_epoch();
+        auto microseconds = std::chrono::duration_cast<std::chrono::microseconds>(duration).count();
+        rngSeed = static_cast<unsigned int>(microseconds + getpid());
+    }
+    srand(rngSeed);
+    seedThreadRngs();
+}
+
+PackingGenerator::~PackingGenerator() {
+    // Smart pointers automatically clean up resources
+}
+
+void PackingGenerator::createSphereIndex() {
+    // Drop the old tree before the storage it lives in
+    spatialIndex.reset();
+    sphereStorage.reset(SpatialIndex::StorageManager::createNewMemoryStorageManager());
     
     // R-tree configuration for optimal performance
     SpatialIndex::id_type indexIdentifier = 1; 
@@ -67,7 +136,7 @@ PackingGenerator::PackingGenerator(
     // Create R-tree for sphere queries
     spatialIndex.reset(
         SpatialIndex::RTree::createNewRTree(
-            *memoryManager, 
+            *sphereStorage, 
             fillFactor, 
             indexCapacity, 
             leafCapacity, 
@@ -76,21 +145,18 @@ PackingGenerator::PackingGenerator(
             indexIdentifier
         )
     );
-    
-    // Initialize random seed for reproducible results
-    if (randomSeed != 0) {
-        srand(randomSeed);
-    } else {
-        // Use microsecond precision + process ID for uniqueness
-        auto now = std::chrono::high_resolution_clock::now();
-        auto duration = now.time_since_epoch();
-        auto microseconds = std::chrono::duration_cast<std::chrono::microseconds>(duration).count();
-        srand(static_cast<unsigned int>(microseconds + getpid()));
-    }
 }
 
-PackingGenerator::~PackingGenerator() {
-    // Smart pointers automatically clean up resources
+void PackingGenerator::reset(double newTargetDensity) {
+    targetDensity = newTargetDensity;
+    numSpheres = 0;
+    
+    // Empty the containers in place so their storage is reused by the next run
+    particles.clear();
+    spheres.clear();
+    voxelGrid.clear();
+    cellList.clear();
+    createSphereIndex();
 }
 
 //=============================================================================
@@ -163,6 +229,10 @@ bool PackingGenerator::generate() {
 //=============================================================================
 
 uint32_t PackingGenerator::insertCoreSpheres() {
+    if (numThreads > 1) {
+        return insertCoreSpheresParallel();
+    }
+    
     uint32_t totalCoreSpheres = 0;
     uint32_t attempts = 0;
     uint32_t maxAttempts = 50000;  // Safety limit to prevent infinite loops
@@ -188,53 +258,16 @@ uint32_t PackingGenerator::insertCoreSpheres() {
             continue;
         }
         
-        // Query spatial index for potential overlaps
-        double centerCoords[3] = {
-            static_cast<double>(x), 
-            static_cast<double>(y), 
-            static_cast<double>(z)
-        };
-        SpatialIndex::Ball queryBall(radius + coreRadiusMax, centerCoords, 3);
-        
-        IdVisitor visitor;
-        spatialIndex->intersectsWithQuery(queryBall, visitor);
-        
-        bool hasExcessiveOverlap = false;
-        
-        // Check each found sphere for actual overlap
-        for (const auto& foundSphereId : visitor.GetResults()) {
-
-            double distance = center.distanceTo(spheres[foundSphereId]->getCenter());
-            double minDistance = radius + spheres[foundSphereId]->getRadius() - MAX_PENETRATION; // Small tolerance
-            
-            if (distance < minDistance) {
-                hasExcessiveOverlap = true;
-                break;
-            }
-        }
-        
-        if (hasExcessiveOverlap) {
+        // Check nearby spheres for excessive overlap
+        if (cellList.hasExcessiveOverlap(center, radius, MAX_PENETRATION)) {
             attempts++;
             consecutiveFailures++;
             continue;
         }
         
-        // Create new particle
-        uint16_t particleId = particles.size();
-        particles.emplace_back(particleId);
-        
-        // Add core sphere to the particle
-        uint32_t sphereId = numSpheres++;
-        const std::shared_ptr<Sphere>& sphere = particles.back().addSphere(center, radius, 
-                                                         SphereType::CORE, sphereId);
-        spheres.emplace_back(sphere);                                                 
-        
-        // Add to voxel grid
-        voxelGrid.addSphere(particles, center, radius, particleId);
-        
-        // Add to spatial index
-        SpatialIndex::Ball sphereBall(radius, centerCoords, 3);
-        spatialIndex->insertData(0, nullptr, sphereBall, sphereId);
+        // Create new particle around the core sphere
+        particles.emplace_back(particles.size());
+        commitSphere(particles.back(), center, radius, SphereType::CORE);
         
         totalCoreSpheres++;
         consecutiveFailures = 0;  // Reset consecutive failures on success
@@ -270,6 +303,10 @@ uint32_t PackingGenerator::insertCoreSpheres() {
 //=============================================================================
 
 uint32_t PackingGenerator::addSecondarySpheres(uint32_t maxAttempts) {
+    if (numThreads > 1) {
+        return addSecondarySpheresParallel(maxAttempts);
+    }
+    
     uint32_t attempts = 0;
     uint32_t successfulInsertions = 0;
     uint32_t consecutiveFailures = 0;
@@ -323,69 +360,24 @@ uint32_t PackingGenerator::addSecondarySpheres(uint32_t maxAttempts) {
             continue;
         }
                 
-        // Verify compactness criteria with existing spheres in the particle
-        bool meetsCriteria = false;
-        
-        // Should be overlapping the core or any other sphere compactly
-        for (const auto& existingSphere : particle.getSpheres()) {
-            if (existingSphere->intersectsWith(center.x, center.y, center.z, secondaryRadius, compactnessFactor)) {
-                meetsCriteria = true;
-                break;
-            }
-        }
-        
-        if (!meetsCriteria) {
+        // Verify compactness criteria with existing spheres in the particle:
+        // should be overlapping the core or any other sphere compactly
+        if (!particle.isCompactWith(center, secondaryRadius, compactnessFactor)) {
             attempts++;
             consecutiveFailures++;
             continue;
         }
         
         // Check for excessive overlap with other particles
-        double sphereCenterCoords[3] = {
-            static_cast<double>(center.x), 
-            static_cast<double>(center.y), 
-            static_cast<double>(center.z)
-        };
-
-        SpatialIndex::Ball queryBall(secondaryRadius + secondaryRadiusMax, sphereCenterCoords, 3);
-        
-        IdVisitor visitor;
-        spatialIndex->intersectsWithQuery(queryBall, visitor);
-        
-        bool hasExcessOverlap = false;
-        
-        for (const auto foundSphereId : visitor.GetResults()) {
-            if (spheres[foundSphereId]->getParticleId() != particle.getId()) {
-                double distance = center.distanceTo(spheres[foundSphereId]->getCenter());
-                 double minDistance = secondaryRadius + spheres[foundSphereId]->getRadius() - MAX_PENETRATION;
-                
-                if (distance < minDistance) {
-                    hasExcessOverlap = true;
-                    break;
-                }
-            }
-        }
-        
-        if (hasExcessOverlap) {
+        if (cellList.hasExcessiveOverlap(center, secondaryRadius, MAX_PENETRATION, particle.getId())) {
             attempts++;
             consecutiveFailures++;
             continue;
         }
         
         // Add the sphere to the particle
-        uint32_t sphereId = numSpheres;
-        const std::shared_ptr<Sphere>& sphere = particle.addSphere(center, secondaryRadius, 
-                                                 SphereType::SECONDARY, sphereId);
-        
-        // Add to voxel grid
-        voxelGrid.addSphere(particles, center, secondaryRadius, particle.getId());
+        commitSphere(particle, center, secondaryRadius, SphereType::SECONDARY);
         
-        // Add to spatial index
-        SpatialIndex::Ball sphereBall(secondaryRadius, sphereCenterCoords, 3);
-        spatialIndex->insertData(0, nullptr, sphereBall, sphereId);
-        spheres.emplace_back(sphere); 
-
-        numSpheres++;
         successfulInsertions++;
         consecutiveFailures = 0;
         
@@ -412,6 +404,228 @@ uint32_t PackingGenerator::addSecondarySpheres(uint32_t maxAttempts) {
     return successfulInsertions;
 }
 
+//=============================================================================
+// Parallel Insertion (Stages 1 and 2)
+//=============================================================================
+
+void PackingGenerator::setThreads(int threads) {
+#ifdef _OPENMP
+    numThreads = threads > 0 ? threads : omp_get_max_threads();
+#else
+    (void)threads;
+    numThreads = 1;
+#endif
+    seedThreadRngs();
+}
+
+void PackingGenerator::seedThreadRngs() {
+    threadRngs.clear();
+    for (int t = 0; t < numThreads; ++t) {
+        std::seed_seq seq{rngSeed, static_cast<uint32_t>(t)};
+        threadRngs.emplace_back(seq);
+    }
+}
+
+PackingGenerator::Candidate PackingGenerator::proposeCoreSphere(std::mt19937_64& rng) const {
+    std::uniform_int_distribution<int> coordinate(0, static_cast<int>(size) - 1);
+    std::uniform_int_distribution<int> radius(coreRadiusMin, coreRadiusMax);
+    
+    Candidate candidate;
+    candidate.center = Point3D(coordinate(rng), coordinate(rng), coordinate(rng));
+    candidate.radius = radius(rng);
+    candidate.particleIndex = 0;
+    
+    const Point3D& c = candidate.center;
+    int r = candidate.radius;
+    candidate.valid =
+        c.x - r >= 0 && c.x + r < static_cast<int>(size) &&
+        c.y - r >= 0 && c.y + r < static_cast<int>(size) &&
+        c.z - r >= 0 && c.z + r < static_cast<int>(size) &&
+        !cellList.hasExcessiveOverlap(c, r, MAX_PENETRATION);
+    return candidate;
+}
+
+PackingGenerator::Candidate PackingGenerator::proposeSecondarySphere(std::mt19937_64& rng) const {
+    std::uniform_int_distribution<uint32_t> particleIndex(0, particles.size() - 1);
+    std::uniform_int_distribution<int> degrees(0, 359);
+    std::uniform_int_distribution<int> radius(secondaryRadiusMin, secondaryRadiusMax);
+    
+    Candidate candidate;
+    candidate.particleIndex = particleIndex(rng);
+    candidate.valid = false;
+    const Particle& particle = particles[candidate.particleIndex];
+    
+    const std::shared_ptr<Sphere> coreSphere = particle.getCoreSphere();
+    int maxDistance = coreSphere ? static_cast<int>(VICINITY_RATIO * coreSphere->getRadius()) : 0;
+    if (maxDistance <= 0) {
+        return candidate;
+    }
+    
+    // Same placement around the core as the serial stage
+    double angle1 = degrees(rng) * M_PI / 180.0;
+    double angle2 = degrees(rng) * M_PI / 180.0;
+    candidate.radius = radius(rng);
+    int distanceFromCore = std::uniform_int_distribution<int>(0, maxDistance - 1)(rng);
+    
+    const Point3D& core = coreSphere->getCenter();
+    candidate.center = Point3D(
+        core.x + static_cast<int>(distanceFromCore * sin(angle1) * cos(angle2)),
+        core.y + static_cast<int>(distanceFromCore * sin(angle1) * sin(angle2)),
+        core.z + static_cast<int>(distanceFromCore * cos(angle1))
+    );
+    
+    const Point3D& c = candidate.center;
+    int r = candidate.radius;
+    candidate.valid =
+        c.x - r >= 0 && c.x + r < static_cast<int>(size) &&
+        c.y - r >= 0 && c.y + r < static_cast<int>(size) &&
+        c.z - r >= 0 && c.z + r < static_cast<int>(size) &&
+        particle.isCompactWith(c, r, compactnessFactor) &&
+        !cellList.hasExcessiveOverlap(c, r, MAX_PENETRATION, particle.getId());
+    return candidate;
+}
+
+uint32_t PackingGenerator::insertCoreSpheresParallel() {
+    uint32_t totalCoreSpheres = 0;
+    uint32_t attempts = 0;
+    uint32_t maxAttempts = 50000;
+    uint32_t consecutiveFailures = 0;
+    uint32_t maxConsecutiveFailures = 5000;
+    bool densityReached = false;
+    
+    std::vector<Candidate> batch(CANDIDATES_PER_THREAD * numThreads);
+    
+    while (!densityReached && attempts < maxAttempts && consecutiveFailures < maxConsecutiveFailures) {
+        // Propose and check candidates in parallel; the packing is read-only here
+        #pragma omp parallel for num_threads(numThreads) schedule(static)
+        for (int i = 0; i < static_cast<int>(batch.size()); ++i) {
+            batch[i] = proposeCoreSphere(threadRngs[currentThread()]);
+        }
+        
+        // Commit in batch order, rechecking against spheres committed from this batch
+        for (const Candidate& candidate : batch) {
+            if (attempts >= maxAttempts || consecutiveFailures >= maxConsecutiveFailures) {
+                break;
+            }
+            attempts++;
+            
+            if (!candidate.valid ||
+                cellList.hasExcessiveOverlap(candidate.center, candidate.radius, MAX_PENETRATION)) {
+                consecutiveFailures++;
+                continue;
+            }
+            
+            particles.emplace_back(particles.size());
+            commitSphere(particles.back(), candidate.center, candidate.radius, SphereType::CORE);
+            
+            totalCoreSpheres++;
+            consecutiveFailures = 0;
+            
+            double density = getCurrentDensity();
+            if (density > 0.7 * targetDensity) {
+                std::cout << "    Core sphere insertion stopped due to density target reached: " 
+                          << density << " (target: " << 0.7 * targetDensity << ")" << std::endl;
+                densityReached = true;
+                break;
+            }
+            
+            if (totalCoreSpheres % 50 == 0) {
+                std::cout << "    Progress: " << totalCoreSpheres << " core spheres, "
+                          << "density: " << density << std::endl;
+            }
+        }
+    }
+    if (attempts >= maxAttempts) {
+        std::cout << "    Core sphere insertion stopped due to max attempts reached: " 
+                  << maxAttempts << " attempts" << std::endl;
+    }
+    if (consecutiveFailures >= maxConsecutiveFailures) {
+        std::cout << "    Core sphere insertion stopped due to consecutive failures" << std::endl;
+    }
+    
+    return totalCoreSpheres;
+}
+
+uint32_t PackingGenerator::addSecondarySpheresParallel(uint32_t maxAttempts) {
+    uint32_t attempts = 0;
+    uint32_t successfulInsertions = 0;
+    uint32_t consecutiveFailures = 0;
+    uint32_t maxConsecutiveFailures = 500;
+    bool densityReached = false;
+    
+    if (particles.empty()) {
+        return 0;
+    }
+    
+    std::vector<Candidate> batch(CANDIDATES_PER_THREAD * numThreads);
+    
+    while (!densityReached && attempts < maxAttempts && consecutiveFailures < maxConsecutiveFailures) {
+        // Propose and check candidates in parallel; the packing is read-only here
+        #pragma omp parallel for num_threads(numThreads) schedule(static)
+        for (int i = 0; i < static_cast<int>(batch.size()); ++i) {
+            batch[i] = proposeSecondarySphere(threadRngs[currentThread()]);
+        }
+        
+        // Commit in batch order. Compactness only gets easier as a particle grows,
+        // so only the overlap with other particles has to be rechecked.
+        for (const Candidate& candidate : batch) {
+            if (attempts >= maxAttempts || consecutiveFailures >= maxConsecutiveFailures) {
+                break;
+            }
+            attempts++;
+            
+            Particle& particle = particles[candidate.particleIndex];
+            if (!candidate.valid ||
+                cellList.hasExcessiveOverlap(candidate.center, candidate.radius, 
+                                             MAX_PENETRATION, particle.getId())) {
+                consecutiveFailures++;
+                continue;
+            }
+            
+            commitSphere(particle, candidate.center, candidate.radius, SphereType::SECONDARY);
+            
+            successfulInsertions++;
+            consecutiveFailures = 0;
+            
+            double density = getCurrentDensity();
+            if (density > 0.85 * targetDensity) {
+                densityReached = true;
+                break;
+            }
+            
+            if (successfulInsertions % 100 == 0) {
+                std::cout << "    Progress: " << successfulInsertions << " secondary spheres, "
+                          << "density: " << density << std::endl;
+            }
+        }
+    }
+
+    if (consecutiveFailures >= maxConsecutiveFailures) {
+        std::cout << "    Secondary sphere insertion stopped due to consecutive failures" << std::endl;
+    }
+
+    return successfulInsertions;
+}
+
+void PackingGenerator::commitSphere(Particle& particle, const Point3D& center, int radius, 
+                                    SphereType type) {
+    uint32_t sphereId = numSpheres++;
+    spheres.emplace_back(particle.addSphere(center, radius, type, sphereId));
+    
+    // Add to voxel grid
+    voxelGrid.addSphere(particles, center, radius, particle.getId());
+    
+    // Add to spatial index and cell list
+    double centerCoords[3] = {
+        static_cast<double>(center.x), 
+        static_cast<double>(center.y), 
+        static_cast<double>(center.z)
+    };
+    SpatialIndex::Ball sphereBall(radius, centerCoords, 3);
+    spatialIndex->insertData(0, nullptr, sphereBall, sphereId);
+    cellList.insert(center, radius, particle.getId());
+}
+
 //=============================================================================
 // Stage 3: Tertiary Sphere Addition
 //=============================================================================
@@ -474,15 +688,7 @@ uint32_t PackingGenerator::addTertiarySpheres(uint32_t maxAttempts) {
         }
                 
         // Verify connection with at least one sphere in the particle
-        bool isConnected = false;
-        for (const auto& existingSphere : particleSpheres) {
-            if (existingSphere->intersectsWith(center.x, center.y, center.z, tertiaryRadius, compactnessFactor)) {
-                isConnected = true;
-                break;
-            }
-        }
-        
-        if (!isConnected) {
+        if (!particle.isCompactWith(center, tertiaryRadius, compactnessFactor)) {
             attempts++;
             consecutiveFailures++;
             continue;
@@ -502,9 +708,10 @@ uint32_t PackingGenerator::addTertiarySpheres(uint32_t maxAttempts) {
         // Add to voxel grid (will automatically detect contacts)
         voxelGrid.addSphere(particles, center, tertiaryRadius, particle.getId());
         
-        // Add to spatial index
+        // Add to spatial index and cell list
         SpatialIndex::Ball sphereBall(tertiaryRadius, sphereCenterCoords, 3);
         spatialIndex->insertData(0, nullptr, sphereBall, sphereId);
+        cellList.insert(center, tertiaryRadius, particle.getId());
         
         numSpheres++;
         successfulInsertions++;
@@ -551,6 +758,14 @@ bool PackingGenerator::insertSuppSpheres(int x, int y, int z, int radius, uint16
         return false; // Particle not found
     }    
     
+    // Sphere must fit the compact coordinate and radius storage
+    if (radius < 0 || radius > MAX_SPHERE_RADIUS ||
+        std::abs(x) > std::numeric_limits<int16_t>::max() ||
+        std::abs(y) > std::numeric_limits<int16_t>::max() ||
+        std::abs(z) > std::numeric_limits<int16_t>::max()) {
+        return false;
+    }
+    
     // Add the sphere to the particle
     uint32_t sphereId = numSpheres;
     Point3D center(x, y, z);
@@ -568,6 +783,7 @@ bool PackingGenerator::insertSuppSpheres(int x, int y, int z, int radius, uint16
     };
     SpatialIndex::Ball sphereBall(radius, sphereCenterCoords, 3);
     spatialIndex->insertData(0, nullptr, sphereBall, sphereId);
+    cellList.insert(center, radius, particle->getId());
     spheres.emplace_back(sphere);
     
     numSpheres++;
@@ -575,6 +791,10 @@ bool PackingGenerator::insertSuppSpheres(int x, int y, int z, int radius, uint16
     return true;
 }
 
+void PackingGenerator::setCellSize(uint32_t cellSize) {
+    cellList.setCellSize(cellSize);
+}
+
 //=============================================================================
 // Property Calculation Methods
 //=============================================================================
@@ -629,6 +849,46 @@ std::vector<uint32_t> PackingGenerator::getCoordinationNumbers() const {
     return result;
 }
 
+std::vector<uint32_t> PackingGenerator::getVolumes() const {
+    std::vector<uint32_t> result;
+    result.reserve(particles.size());
+    
+    for (const auto& particle : particles) {
+        result.push_back(particle.getVolume());
+    }
+    
+    return result;
+}
+
+std::vector<uint32_t> PackingGenerator::getAreas() const {
+    std::vector<uint32_t> result;
+    result.reserve(particles.size());
+    
+    for (const auto& particle : particles) {
+        result.push_back(particle.getArea());
+    }
+    
+    return result;
+}
+
+std::vector<double> PackingGenerator::getSphericities() const {
+    std::vector<double> result;
+    result.reserve(particles.size());
+    
+    for (const auto& particle : particles) {
+        result.push_back(particle.calculateSphericity());
+    }
+    
+    return result;
+}
+
+void PackingGenerator::freeze() {
+    #pragma omp parallel for schedule(static)
+    for (int i = 0; i < static_cast<int>(particles.size()); ++i) {
+        particles[i].calculateSphericity();
+    }
+}
+
 double PackingGenerator::getAverageSphericity() const {
     if (particles.empty()) {
         return 0.0;
@@ -688,8 +948,9 @@ std::set<std::pair<uint16_t, uint16_t>> PackingGenerator::getContactPairs() cons
 // File Output Method
 //=============================================================================
 
-bool PackingGenerator::saveTIFF(const std::string& filename, bool binary) const {
-    return voxelGrid.saveToTIFF(filename, binary);
+bool PackingGenerator::saveTIFF(const std::string& filename, bool binary,
+                                TiffCompression compression) const {
+    return voxelGrid.saveToTIFF(filename, binary, compression);
 }
 
 //=============================================================================
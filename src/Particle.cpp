@@ -19,16 +19,45 @@ namespace Packing {
 //=============================================================================
 
 Particle::Particle(uint16_t id) 
-    : id(id), bulkCount(0), surfaceCount(0) {
+    : id(id), bulkCount(0), surfaceCount(0), cachedSphericity(-1.0) {
 }
 
 const std::shared_ptr<Sphere>& Particle::addSphere(const Point3D& center, int radius, 
                                  SphereType type, uint32_t sphereID) {
     // Create and add the sphere to this particle
     spheres.emplace_back(std::make_shared<Sphere>(center, radius, type, id, sphereID)); 
+    
+    // Mirror its data into the contiguous arrays
+    centers.push_back(static_cast<int16_t>(center.x));
+    centers.push_back(static_cast<int16_t>(center.y));
+    centers.push_back(static_cast<int16_t>(center.z));
+    radii.push_back(static_cast<uint8_t>(radius));
+    types.push_back(static_cast<uint8_t>(type));
+    
     return spheres.back();                          
 }
 
+bool Particle::isCompactWith(const Point3D& center, int radius, double beta) const {
+    for (size_t i = 0; i < radii.size(); ++i) {
+        // Calculate center-to-center distance
+        double dx = static_cast<double>(center.x - centers[3 * i]);
+        double dy = static_cast<double>(center.y - centers[3 * i + 1]);
+        double dz = static_cast<double>(center.z - centers[3 * i + 2]);
+        double distance = std::sqrt(dx*dx + dy*dy + dz*dz);
+        
+        // Ensure the larger radius is r2 and smaller is r1
+        int otherRadius = radii[i];
+        double r1 = static_cast<double>(std::min(radius, otherRadius));
+        double r2 = static_cast<double>(std::max(radius, otherRadius));
+        
+        // Same criteria as Sphere::intersectsWith: r2 - r1 < d ≤ r2 - (β × r1)
+        if (r2 - r1 < distance && distance <= r2 - (beta * r1)) {
+            return true;
+        }
+    }
+    return false;
+}
+
 const std::shared_ptr<Sphere> Particle::getCoreSphere() const {
     // Search for the core sphere in the collection
     for (const auto& sphere : spheres) {
@@ -40,13 +69,18 @@ const std::shared_ptr<Sphere> Particle::getCoreSphere() const {
 }
 
 double Particle::calculateSphericity() const {
+    if (cachedSphericity >= 0.0) {
+        return cachedSphericity;
+    }
+    
     // Get volume and surface area in voxels
     double volume = static_cast<double>(getVolume());
     double area = static_cast<double>(getArea());
     
     // Avoid division by zero
     if (area == 0) {
-        return 0.0;
+        cachedSphericity = 0.0;
+        return cachedSphericity;
     }
               
     // Apply sphericity formula from the paper
@@ -54,7 +88,8 @@ double Particle::calculateSphericity() const {
     double sphericity = (36.0 * M_PI * std::pow(volume, 2)) / std::pow(area, 3);
     
     // Clamp result to valid range [0, 1]
-    return std::min(1.0, std::max(0.0, sphericity));
+    cachedSphericity = std::min(1.0, std::max(0.0, sphericity));
+    return cachedSphericity;
 }
 
 void Particle::addContact(uint16_t particleId) {
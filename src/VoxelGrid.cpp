@@ -14,9 +14,13 @@
 #include <algorithm>
 #include <iostream>
 #include <list>
+#include <vector>
+#include <zlib.h>
 
 namespace Packing {
 
+const uint32_t TIFF_TILE_SIZE = 128;  ///< Tile edge length for compressed TIFF output
+
 //=============================================================================
 // VoxelGrid Implementation - Construction and Basic Operations
 //=============================================================================
@@ -40,8 +44,13 @@ VoxelGrid::VoxelGrid(uint32_t size)
     }
 
     // Initialize spatial index for interface segments
-    SpatialIndex::IStorageManager* memoryManager = 
-        SpatialIndex::StorageManager::createNewMemoryStorageManager();
+    createSegmentIndex();
+}
+
+void VoxelGrid::createSegmentIndex() {
+    // Drop the old tree before the storage it lives in
+    spatialIndexSegs.reset();
+    segmentStorage.reset(SpatialIndex::StorageManager::createNewMemoryStorageManager());
     
     // R-tree configuration
     SpatialIndex::id_type indexIdentifier = 1; 
@@ -54,7 +63,7 @@ VoxelGrid::VoxelGrid(uint32_t size)
     // Create R-tree for efficient segment queries
     spatialIndexSegs.reset(
         SpatialIndex::RTree::createNewRTree(
-            *memoryManager, 
+            *segmentStorage, 
             fillFactor, 
             indexCapacity, 
             leafCapacity, 
@@ -75,6 +84,18 @@ VoxelGrid::~VoxelGrid() {
     delete[] grid;
 }
 
+void VoxelGrid::clear() {
+    // Zero the chunks in place
+    for (uint32_t i = 0; i < numChunks * numChunks * numChunks; ++i) {
+        std::fill(grid[i], grid[i] + chunkSize * chunkSize * chunkSize, 0);
+    }
+    
+    filledVoxelCount = 0;
+    interfaceSegsCount = 0;
+    interfacialSegments.clear();
+    createSegmentIndex();
+}
+
 //=============================================================================
 // Sphere Addition Operations
 //=============================================================================
@@ -537,7 +558,8 @@ VoxelGrid::createMask(int radius) {
 // File Output Operations
 //=============================================================================
 
-bool VoxelGrid::saveToTIFF(const std::string& filename, bool binary) const {
+bool VoxelGrid::saveToTIFF(const std::string& filename, bool binary,
+                           TiffCompression compression) const {
     // Open TIFF file for writing
     TIFF* tif = TIFFOpen(filename.c_str(), "w");
     if (!tif) {
@@ -546,7 +568,7 @@ bool VoxelGrid::saveToTIFF(const std::string& filename, bool binary) const {
     }
     
     // Buffer for one Z-slice
-    uint16_t* buffer = new uint16_t[size * size];
+    std::vector<uint16_t> buffer(size * size);
     
     // Write each Z-slice as a TIFF page
     for (uint32_t z = 0; z < size; ++z) {
@@ -559,48 +581,129 @@ bool VoxelGrid::saveToTIFF(const std::string& filename, bool binary) const {
         TIFFSetField(tif, TIFFTAG_ORIENTATION, ORIENTATION_TOPLEFT);
         TIFFSetField(tif, TIFFTAG_PLANARCONFIG, PLANARCONFIG_CONTIG);
         TIFFSetField(tif, TIFFTAG_PHOTOMETRIC, PHOTOMETRIC_MINISBLACK);
-        TIFFSetField(tif, TIFFTAG_ROWSPERSTRIP, TIFFDefaultStripSize(tif, size));
         TIFFSetField(tif, TIFFTAG_PAGENUMBER, z, size);
         
-        // Fill buffer with slice data
-        for (uint32_t y = 0; y < size; ++y) {
-            for (uint32_t x = 0; x < size; ++x) {
-                Point3D point(x, y, z);
-                uint16_t val = getVoxel(point);
-                
-                // Convert to binary if requested
-                if (binary) {
-                    buffer[y * size + x] = val > 0 ? 65535 : 0;
-                } else {
-                    buffer[y * size + x] = val;
-                }
-            }
+        if (compression == TiffCompression::NONE) {
+            TIFFSetField(tif, TIFFTAG_ROWSPERSTRIP, TIFFDefaultStripSize(tif, size));
+        } else {
+            TIFFSetField(tif, TIFFTAG_TILEWIDTH, TIFF_TILE_SIZE);
+            TIFFSetField(tif, TIFFTAG_TILELENGTH, TIFF_TILE_SIZE);
+            TIFFSetField(tif, TIFFTAG_COMPRESSION, 
+                         compression == TiffCompression::LZW ? COMPRESSION_LZW 
+                                                             : COMPRESSION_ADOBE_DEFLATE);
         }
         
-        // Write scanlines
-        for (uint32_t row = 0; row < size; ++row) {
-            if (TIFFWriteScanline(tif, &buffer[row * size], row, 0) < 0) {
-                std::cerr << "Failed to write scanline " << row << std::endl;
-                delete[] buffer;
-                TIFFClose(tif);
-                return false;
+        // Fill buffer with slice data
+        fillSlice(z, binary, buffer.data());
+        
+        if (compression == TiffCompression::NONE) {
+            // Write scanlines
+            for (uint32_t row = 0; row < size; ++row) {
+                if (TIFFWriteScanline(tif, &buffer[row * size], row, 0) < 0) {
+                    std::cerr << "Failed to write scanline " << row << std::endl;
+                    TIFFClose(tif);
+                    return false;
+                }
             }
+        } else if (!writeTiles(tif, buffer.data(), compression)) {
+            std::cerr << "Failed to write tiles for slice " << z << std::endl;
+            TIFFClose(tif);
+            return false;
         }
         
         // Write directory for this page
         if (!TIFFWriteDirectory(tif)) {
             std::cerr << "Failed to write directory for slice " << z << std::endl;
-            delete[] buffer;
             TIFFClose(tif);
             return false;
         }
     }
     
     // Cleanup
-    delete[] buffer;
     TIFFClose(tif);
     
     return true;
 }
 
+void VoxelGrid::fillSlice(uint32_t z, bool binary, uint16_t* buffer) const {
+    for (uint32_t y = 0; y < size; ++y) {
+        for (uint32_t x = 0; x < size; ++x) {
+            Point3D point(x, y, z);
+            uint16_t val = getVoxel(point);
+            
+            // Convert to binary if requested
+            if (binary) {
+                buffer[y * size + x] = val > 0 ? 65535 : 0;
+            } else {
+                buffer[y * size + x] = val;
+            }
+        }
+    }
+}
+
+bool VoxelGrid::writeTiles(TIFF* tif, const uint16_t* slice, 
+                           TiffCompression compression) const {
+    const uint32_t tilesAcross = (size + TIFF_TILE_SIZE - 1) / TIFF_TILE_SIZE;
+    const int tileCount = static_cast<int>(tilesAcross * tilesAcross);
+    const size_t tileBytes = TIFF_TILE_SIZE * TIFF_TILE_SIZE * sizeof(uint16_t);
+    
+    // Copy each tile out of the slice, padding edge tiles with zeros
+    std::vector<std::vector<uint16_t>> tiles(tileCount);
+    
+    // Deflate-compressed tiles (zlib stream format, as libtiff expects)
+    std::vector<std::vector<Bytef>> compressed(tileCount);
+    bool compressionFailed = false;
+    
+    #pragma omp parallel for schedule(dynamic)
+    for (int t = 0; t < tileCount; ++t) {
+        std::vector<uint16_t>& tile = tiles[t];
+        tile.assign(TIFF_TILE_SIZE * TIFF_TILE_SIZE, 0);
+        
+        uint32_t x0 = (t % tilesAcross) * TIFF_TILE_SIZE;
+        uint32_t y0 = (t / tilesAcross) * TIFF_TILE_SIZE;
+        uint32_t width = std::min(TIFF_TILE_SIZE, size - x0);
+        uint32_t height = std::min(TIFF_TILE_SIZE, size - y0);
+        
+        for (uint32_t row = 0; row < height; ++row) {
+            std::copy(slice + (y0 + row) * size + x0,
+                      slice + (y0 + row) * size + x0 + width,
+                      tile.begin() + row * TIFF_TILE_SIZE);
+        }
+        
+        // LZW tiles are encoded by libtiff when they are written
+        if (compression != TiffCompression::DEFLATE) {
+            continue;
+        }
+        
+        uLongf compressedSize = compressBound(tileBytes);
+        compressed[t].resize(compressedSize);
+        if (compress2(compressed[t].data(), &compressedSize,
+                      reinterpret_cast<const Bytef*>(tile.data()), tileBytes,
+                      Z_DEFAULT_COMPRESSION) != Z_OK) {
+            #pragma omp atomic write
+            compressionFailed = true;
+        }
+        compressed[t].resize(compressedSize);
+    }
+    
+    if (compressionFailed) {
+        return false;
+    }
+    
+    // libtiff handles are not thread-safe, so tiles are written in order
+    for (int t = 0; t < tileCount; ++t) {
+        tmsize_t written;
+        if (compression == TiffCompression::DEFLATE) {
+            written = TIFFWriteRawTile(tif, t, compressed[t].data(), compressed[t].size());
+        } else {
+            written = TIFFWriteEncodedTile(tif, t, tiles[t].data(), tileBytes);
+        }
+        if (written < 0) {
+            return false;
+        }
+    }
+    
+    return true;
+}
+
 } // namespace Packing
\ No newline at end of file
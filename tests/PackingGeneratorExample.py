@@ -6,10 +6,13 @@ This script demonstrates how to create, configure, and analyze particle packings
 
 import os
 import sys
-import gc  # Added missing import for garbage collector
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+
+# Numba is optional; without it the sphere meshes are built with NumPy broadcasting
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # Add the directory containing the module to Python's path
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "build/python"))
@@ -24,6 +27,76 @@ except ImportError:
     print("  import sys; sys.path.append('/path/to/build/python')")
     sys.exit(1)
 
+# Unit-sphere wireframe mesh shared by all particle visualizations
+_U, _V = np.mgrid[0:2*np.pi:20j, 0:np.pi:10j]
+_UNIT_SPHERE = np.stack([np.cos(_U) * np.sin(_V), np.sin(_U) * np.sin(_V), np.cos(_V)], axis=-1)
+
+# Largest number of particles drawn in an analysis scatter plot
+_MAX_SCATTER_POINTS = 20000
+
+# Wireframe RGBA colors indexed by sphere type (CORE, SECONDARY, TERTIARY)
+_SPHERE_COLORS = np.array([
+    (1.0, 0.0, 0.0, 0.7),          # red
+    (0.0, 128 / 255, 0.0, 0.5),    # green
+    (0.0, 0.0, 1.0, 0.3)           # blue
+])
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _build_meshes(xyz, r, unit, out):
+        """Scale and translate the unit-sphere mesh into out[i] for every sphere i."""
+        for i in prange(xyz.shape[0]):
+            for a in range(unit.shape[0]):
+                for b in range(unit.shape[1]):
+                    for k in range(3):
+                        out[i, a, b, k] = xyz[i, k] + r[i] * unit[a, b, k]
+else:
+    def _build_meshes(xyz, r, unit, out):
+        """Scale and translate the unit-sphere mesh into out[i] for every sphere i."""
+        np.multiply(r[:, None, None, None], unit, out=out)
+        out += xyz[:, None, None, :]
+
+def _import_pyplot():
+    """
+    Import pyplot for headless use.
+    
+    The example only writes image files, so the non-interactive Agg backend is
+    selected unless pyplot is already loaded or MPLBACKEND chooses a backend.
+    
+    Returns:
+        The matplotlib.pyplot module
+    """
+    import matplotlib
+    if 'matplotlib.pyplot' not in sys.modules and 'MPLBACKEND' not in os.environ:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+def _build_generator(size, core_radius_range, secondary_radius_range, tertiary_radius_range,
+                     target_density, compactness_factor, cell_size, threads):
+    """
+    Construct a PackingGenerator and apply the optional cell size and thread count.
+    
+    Returns:
+        generator: The configured PackingGenerator, not yet generated
+    """
+    generator = pp.PackingGenerator(
+        size,
+        core_radius_range[0], core_radius_range[1],
+        secondary_radius_range[0], secondary_radius_range[1],
+        tertiary_radius_range[0], tertiary_radius_range[1],
+        target_density,
+        compactness_factor
+    )
+    
+    if cell_size is not None:
+        generator.setCellSize(cell_size)
+    
+    if threads is not None:
+        generator.setThreads(threads)
+    
+    return generator
+
 def create_packing(
     size=300,
     core_radius_range=(30, 40),
@@ -31,6 +104,8 @@ def create_packing(
     tertiary_radius_range=(5, 10),
     target_density=0.65,
     compactness_factor=0.5,
+    cell_size=None,
+    threads=None,
     output_file="python_exports/packing.tiff"
 ):
     """
@@ -44,6 +119,8 @@ def create_packing(
         tertiary_volume_fraction: Volume fraction of tertiary spheres
         target_density: Target packing density
         compactness_factor: Factor controlling sphere overlap (0-1)
+        cell_size: Edge length of the overlap-test cell list (None keeps the default)
+        threads: Threads used for sphere insertion (None keeps the serial default, 0 uses all cores)
         output_file: Filename for the output TIFF file
         
     Returns:
@@ -52,14 +129,9 @@ def create_packing(
     print(f"Creating packing with size {size} and target density {target_density}...")
     
     # Create generator
-    generator = pp.PackingGenerator(
-        size,
-        core_radius_range[0], core_radius_range[1],
-        secondary_radius_range[0], secondary_radius_range[1],
-        tertiary_radius_range[0], tertiary_radius_range[1],
-        target_density,
-        compactness_factor
-    )
+    generator = _build_generator(size, core_radius_range, secondary_radius_range,
+                                 tertiary_radius_range, target_density, compactness_factor,
+                                 cell_size, threads)
     
     # Generate the packing
     print("Generating packing... (this may take a while)")
@@ -80,11 +152,56 @@ def create_packing(
     # Save the packing
     print(f"\nSaving packing to {output_file}...")
     os.makedirs(os.path.dirname(output_file), exist_ok=True)  # Ensure directory exists
-    generator.saveTIFF(output_file, True)
+    generator.saveTIFF(output_file, True, compression="deflate")
     print("Done!")
     
     return generator
 
+def compile_generator(
+    generator=None,
+    size=300,
+    core_radius_range=(30, 40),
+    secondary_radius_range=(20, 30),
+    tertiary_radius_range=(5, 10),
+    target_density=0.65,
+    compactness_factor=0.5,
+    cell_size=None,
+    threads=None
+):
+    """
+    Build a reusable generator for sweeps over the target density.
+    
+    The generator and its voxel grid, cell list and sphere masks are allocated
+    once; every run resets them in place instead of constructing a new generator.
+    
+    Args:
+        generator: Existing PackingGenerator to reuse, e.g. from create_packing; when
+            given, its configuration is kept and the remaining arguments are ignored
+        size: Size of the cubic domain
+        core_radius_range: (min, max) range for core sphere radii
+        secondary_radius_range: (min, max) range for secondary sphere radii
+        tertiary_radius_range: (min, max) range for tertiary sphere radii
+        target_density: Target packing density the generator is constructed with
+        compactness_factor: Factor controlling sphere overlap (0-1)
+        cell_size: Edge length of the overlap-test cell list (None keeps the default)
+        threads: Threads used for sphere insertion (None keeps the serial default, 0 uses all cores)
+        
+    Returns:
+        run: Function taking a target density and returning the generator holding the
+            new packing; each call overwrites the packing of the previous one
+    """
+    if generator is None:
+        generator = _build_generator(size, core_radius_range, secondary_radius_range,
+                                     tertiary_radius_range, target_density, compactness_factor,
+                                     cell_size, threads)
+    
+    def run(target_density):
+        generator.reset(target_density)
+        generator.generate()
+        return generator
+    
+    return run
+
 def analyze_packing(generator):
     """
     Analyze a generated packing and produce some plots.
@@ -92,6 +209,9 @@ def analyze_packing(generator):
     Args:
         generator: The PackingGenerator object to analyze
     """
+    # Plotting libraries are imported here so that generating a packing does not pay for them
+    plt = _import_pyplot()
+    
     if generator is None or generator.getParticleCount() == 0:
         print("No valid packing to analyze.")
         return
@@ -99,45 +219,52 @@ def analyze_packing(generator):
     # Get coordination numbers
     coord_numbers = generator.getCoordinationNumbers()
     
-    # Plot coordination number distribution
-    plt.figure(figsize=(10, 6))
-    bins = np.arange(min(coord_numbers), max(coord_numbers) + 2) - 0.5
-    plt.hist(coord_numbers, bins=bins, alpha=0.7, color='blue', edgecolor='black')
-    plt.xlabel('Coordination Number')
-    plt.ylabel('Frequency')
-    plt.title('Particle Coordination Number Distribution')
-    plt.grid(alpha=0.3)
-    plt.savefig('python_exports/coordination_distribution.png')
+    # All plots are drawn into one figure that is cleared between them
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    # Plot coordination number distribution (one bar per integer value)
+    counts = np.bincount(coord_numbers)
+    ax.bar(np.arange(counts.size), counts, width=1.0, alpha=0.7, color='blue', edgecolor='black')
+    ax.set_xlabel('Coordination Number')
+    ax.set_ylabel('Frequency')
+    ax.set_title('Particle Coordination Number Distribution')
+    ax.grid(alpha=0.3)
+    fig.savefig('python_exports/coordination_distribution.png', dpi=96, bbox_inches='tight')
     print("Saved coordination number distribution to coordination_distribution.png")
     
-    # Get all particles for analysis
-    particles = generator.getParticles()
-    
-    # Extract particle properties
-    volumes = [p.getVolume() for p in particles]
-    areas = [p.getArea() for p in particles]
-    sphericities = [p.calculateSphericity() for p in particles]
-    
-    # Plot sphericity vs coordination number
-    plt.figure(figsize=(10, 6))
-    plt.scatter(sphericities, coord_numbers, alpha=0.5)
-    plt.xlabel('Sphericity')
-    plt.ylabel('Coordination Number')
-    plt.title('Sphericity vs Coordination Number')
-    plt.grid(alpha=0.3)
-    plt.savefig('python_exports/sphericity_vs_coordination.png')
+    # Extract particle properties as arrays, without creating Particle wrappers
+    volumes = generator.getVolumes()
+    areas = generator.getAreas()
+    sphericities = generator.getSphericities()
+    
+    # Scatter plots of very large packings show a fixed random subset of the particles
+    n = len(coord_numbers)
+    idx = np.random.default_rng(0).choice(n, _MAX_SCATTER_POINTS, replace=False) \
+        if n > _MAX_SCATTER_POINTS else slice(None)
+    
+    # Plot sphericity vs coordination number; rasterized markers keep the PNG encode cheap
+    ax.clear()
+    ax.scatter(sphericities[idx], coord_numbers[idx], alpha=0.5, s=4, rasterized=True)
+    ax.set_xlabel('Sphericity')
+    ax.set_ylabel('Coordination Number')
+    ax.set_title('Sphericity vs Coordination Number')
+    ax.grid(alpha=0.3)
+    fig.savefig('python_exports/sphericity_vs_coordination.png', dpi=96, bbox_inches='tight')
     print("Saved sphericity vs coordination plot to sphericity_vs_coordination.png")
     
     # Plot volume vs area
-    plt.figure(figsize=(10, 6))
-    plt.scatter(volumes, areas, alpha=0.5)
-    plt.xlabel('Particle Volume (voxels)')
-    plt.ylabel('Particle Surface Area (voxels)')
-    plt.title('Particle Volume vs Surface Area')
-    plt.grid(alpha=0.3)
-    plt.savefig('python_exports/volume_vs_area.png')
+    ax.clear()
+    ax.scatter(volumes[idx], areas[idx], alpha=0.5, s=4, rasterized=True)
+    ax.set_xlabel('Particle Volume (voxels)')
+    ax.set_ylabel('Particle Surface Area (voxels)')
+    ax.set_title('Particle Volume vs Surface Area')
+    ax.grid(alpha=0.3)
+    fig.savefig('python_exports/volume_vs_area.png', dpi=96, bbox_inches='tight')
     print("Saved volume vs area plot to volume_vs_area.png")
     
+    # Release the figure from pyplot's registry
+    plt.close(fig)
+    
 def visualize_particle(particle, ax=None):
     """
     Visualize a single particle by showing its constituent spheres.
@@ -146,54 +273,32 @@ def visualize_particle(particle, ax=None):
         particle: The Particle object to visualize
         ax: Optional matplotlib 3D axis to plot on
     """
+    plt = _import_pyplot()
+    from mpl_toolkits.mplot3d import Axes3D  # registers the '3d' projection
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+    
     if ax is None:
         fig = plt.figure(figsize=(10, 10))
         ax = fig.add_subplot(111, projection='3d')
     
-    # IMPORTANT: Make safe copies of all data first to avoid reference issues
-    sphere_data = []
-    spheres = particle.getSpheres()  # Get a copy of the spheres list
-    
-    for sphere in spheres:
-        center = sphere.getCenter()
-        sphere_data.append({
-            'x': center.x,
-            'y': center.y, 
-            'z': center.z,
-            'radius': sphere.getRadius(),
-            'type': sphere.getType()
-        })
-        # Force garbage collection - now properly imported at the top of the file
-        gc.collect()
-    
-    # Call explicit garbage collection after processing all spheres
-    pp.collect_garbage()  # Use the garbage collection helper from our bindings
-    gc.collect()
-    
-    # Clear references to help with garbage collection
-    spheres = None
-    
-    # Draw each sphere using our safely copied data
-    for s in sphere_data:
-        # Color based on sphere type
-        if s['type'] == pp.SphereType.CORE:
-            color = 'red'
-            alpha = 0.7
-        elif s['type'] == pp.SphereType.SECONDARY:
-            color = 'green'
-            alpha = 0.5
-        else:  # TERTIARY
-            color = 'blue'
-            alpha = 0.3
-        
-        # Create a wireframe sphere
-        u, v = np.mgrid[0:2*np.pi:20j, 0:np.pi:10j]
-        x = s['x'] + s['radius'] * np.cos(u) * np.sin(v)
-        y = s['y'] + s['radius'] * np.sin(u) * np.sin(v)
-        z = s['z'] + s['radius'] * np.cos(v)
-        
-        # Plot the sphere
-        ax.plot_wireframe(x, y, z, color=color, alpha=alpha)
+    # Contiguous copies of the particle's sphere centers (int16), radii (uint8) and types;
+    # radii are widened so the bounds and meshes below are computed in float64
+    xyz = particle.getCenters()
+    r = particle.getRadii().astype(np.float64)
+    types = particle.getTypes()
+    
+    # Build the wireframes of all spheres at once from the cached unit-sphere mesh
+    points = np.empty((len(xyz),) + _UNIT_SPHERE.shape)  # (S, 20, 10, 3)
+    _build_meshes(xyz, r, _UNIT_SPHERE, points)
+    
+    # Split each mesh into the row and column segments a wireframe draws
+    rows = np.stack([points[:, :, :-1], points[:, :, 1:]], axis=-2).reshape(len(xyz), -1, 2, 3)
+    cols = np.stack([points[:, :-1, :], points[:, 1:, :]], axis=-2).reshape(len(xyz), -1, 2, 3)
+    segments = np.concatenate([rows, cols], axis=1)
+    colors = np.repeat(_SPHERE_COLORS[types], segments.shape[1], axis=0)
+    
+    # Plot all spheres as a single artist
+    ax.add_collection3d(Line3DCollection(segments.reshape(-1, 2, 3), colors=colors))
     
     # Set labels and title
     ax.set_xlabel('X')
@@ -201,24 +306,14 @@ def visualize_particle(particle, ax=None):
     ax.set_zlabel('Z')
     ax.set_title(f'Particle {particle.getId()} - Sphericity: {particle.calculateSphericity():.4f}')
     
-    # Try to maintain aspect ratio (using copies of our data)
-    max_range = max([
-        max(s['x'] + s['radius'] for s in sphere_data) - min(s['x'] - s['radius'] for s in sphere_data),
-        max(s['y'] + s['radius'] for s in sphere_data) - min(s['y'] - s['radius'] for s in sphere_data),
-        max(s['z'] + s['radius'] for s in sphere_data) - min(s['z'] - s['radius'] for s in sphere_data)
-    ])
-    
-    mid_x = (max(s['x'] for s in sphere_data) + min(s['x'] for s in sphere_data)) / 2
-    mid_y = (max(s['y'] for s in sphere_data) + min(s['y'] for s in sphere_data)) / 2
-    mid_z = (max(s['z'] for s in sphere_data) + min(s['z'] for s in sphere_data)) / 2
+    # Try to maintain aspect ratio using the bounds of all spheres
+    lo = (xyz - r[:, None]).min(axis=0)
+    hi = (xyz + r[:, None]).max(axis=0)
+    mid = 0.5 * (lo + hi)
+    half_range = 0.5 * (hi - lo).max()
 
-    ax.set_xlim(mid_x - max_range/2, mid_x + max_range/2)
-    ax.set_ylim(mid_y - max_range/2, mid_y + max_range/2)
-    ax.set_zlim(mid_z - max_range/2, mid_z + max_range/2)
-    
-    # Clear references to help with garbage collection
-    sphere_data = None
-    gc.collect()
+    for set_lim, center in zip((ax.set_xlim, ax.set_ylim, ax.set_zlim), mid):
+        set_lim(center - half_range, center + half_range)
     
     return ax
 
@@ -249,9 +344,18 @@ def main():
     # Analyze the packing
     analyze_packing(generator)
     
+    # Sweep the target density, reusing the analyzed generator's buffers for every run
+    print("\nTarget density sweep:")
+    run = compile_generator(generator)
+    for target_density in (0.55, 0.60, 0.65):
+        sweep = run(target_density)
+        print(f"  Target {target_density:.2f}: density {sweep.getCurrentDensity():.4f}, "
+              f"{sweep.getParticleCount()} particles")
+    
     # Visualize a few particles
     # if generator.getParticleCount() > 0:
     #     print("\nVisualizing example particles...")
+    #     plt = _import_pyplot()
     #     fig = plt.figure(figsize=(15, 5))
         
     #     # Get a few particles with different characteristics